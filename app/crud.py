@@ -1,10 +1,10 @@
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_, func, and_
+from sqlalchemy import or_, func, and_, lambda_stmt, select
 from datetime import datetime, timedelta, date
 from typing import List, Optional
 
 from . import models, schemas, auth
-from .models import RefreshToken, UserProfile, PostType, User, BlockedUser
+from .models import RefreshToken, UserProfile, PostType, User, BlockedUser, OTP
 import uuid
 from uuid import uuid4, UUID
 from .schemas import CountryPhoneData, MessageResponse
@@ -111,8 +111,7 @@ def create_user(db: Session, user_data: dict, hashed_password: str):
     display_name = f"{user_data['first_name']} {user_data['last_name']}"
 
     # 🔍 Derive location using country code
-    country_data = CountryPhoneData()
-    location = country_data.get_country_data(str(user_data["country_code"])).get("country", None)
+    location = CountryPhoneData.get_country_data(str(user_data["country_code"])).get("country", None)
 
     # Create profile with auto-filled location
     db_profile = models.UserProfile(
@@ -213,8 +212,7 @@ def update_user_profile(db: Session, profile_update: schemas.UserProfileUpdate,
 
     # Set location if not already set
     if not profile.location:
-        country_helper = CountryPhoneData()
-        auto_location = country_helper.get_country_data(str(user.country_code)).get("country", None)
+        auto_location = CountryPhoneData.get_country_data(str(user.country_code)).get("country", None)
         profile.location = auto_location
 
     db.commit()
@@ -223,7 +221,17 @@ def update_user_profile(db: Session, profile_update: schemas.UserProfileUpdate,
 
 
 def check_username_exists(db: Session, username: str) -> bool:
-    return db.query(models.User).filter(models.User.username == username).first() is not None
+    stmt = lambda_stmt(lambda: select(User.id).where(User.username == username).limit(1))
+    return db.execute(stmt).first() is not None
+
+def get_latest_signup_otp(db: Session, verified_only: bool = False):
+    """Return the newest unexpired signup OTP, using cached lambda statements"""
+    now = datetime.utcnow()
+    stmt = lambda_stmt(lambda: select(OTP).where(OTP.purpose == "signup", OTP.expires_at > now))
+    if verified_only:
+        stmt += lambda s: s.where(OTP.is_verified == True)
+    stmt += lambda s: s.order_by(OTP.created_at.desc()).limit(1)
+    return db.execute(stmt).scalars().first()
 
 # -------------------- CONNECTION CHECK --------------------
 
@@ -288,6 +296,13 @@ def delete_post(db: Session, post_id: int) -> bool:
 def count_user_posts(db: Session, user_id: int) -> int:
     return db.query(func.count(models.Post.id)).filter(models.Post.user_id == user_id).scalar()
 
+def count_user_connections(db: Session, user_id: int) -> int:
+    # UNION ALL of two single-column lookups instead of an OR filter,
+    # so each side can use its own index
+    as_first = db.query(models.Connection.id).filter(models.Connection.user_id1 == user_id)
+    as_second = db.query(models.Connection.id).filter(models.Connection.user_id2 == user_id)
+    return as_first.union_all(as_second).count()
+
 
 def create_or_get_active_share_token(db: Session, user_id: int):
     existing = db.query(models.SharedProfileLink).filter(
@@ -1,5 +1,6 @@
 from fastapi import FastAPI, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+import logging
 import os
 from dotenv import load_dotenv
 from .models import Base
@@ -12,6 +13,7 @@ from .routes import profiles, connections, posts, chats, search, block, notifica
 
 # Create tables on startup (dev only)
 Base.metadata.create_all(bind=engine)
+models.create_missing_indexes(engine)
 
 # Import routes
 from .routes import signup, login, oauth, forget_password, theme, country_code
@@ -19,6 +21,12 @@ from .routes import signup, login, oauth, forget_password, theme, country_code
 # Load environment variables
 load_dotenv()
 
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
 # Create FastAPI app
 app = FastAPI(
     title="Umbrella Backend API",
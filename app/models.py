@@ -222,13 +222,19 @@ class Connection(Base):
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     user_id1 = Column(Integer, ForeignKey("users.id"))
-    user_id2 = Column(Integer, ForeignKey("users.id"))
+    user_id2 = Column(Integer, ForeignKey("users.id"), index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     __table_args__ = (
         UniqueConstraint('user_id1', 'user_id2', name='unique_connection'),
     )
 
+
+def create_missing_indexes(bind):
+    """create_all() never alters existing tables, so add indexes declared after a table first shipped"""
+    for index in Connection.__table__.indexes:
+        index.create(bind=bind, checkfirst=True)
+
 # -------------------- POST MODEL --------------------
 
 class Post(Base):
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect, Query
 from sqlalchemy.orm import Session
+from pydantic import UUID4
 from typing import List, Optional, Union
 from uuid import UUID, uuid4
 from datetime import datetime
@@ -38,7 +39,7 @@ async def websocket_endpoint(websocket: WebSocket, user_id: int):
             elif event == "leave":
                 await ws_manager.leave_chat(user_id, data["chat_id"])
     except WebSocketDisconnect:
-        await ws_manager.disconnect(user_id)
+        ws_manager.disconnect(user_id)
 
 # ------------------------ Group Chat Management ------------------------
 @router.post("/group/create", response_model=schemas.GroupResponse)
@@ -131,8 +132,8 @@ def handle_chat_request_action(
 # ------------------------ Unified Message Handler ------------------------
 @router.post("/messages/action")
 def message_handler(
-    chat_id: Optional[UUID] = None,
-    group_id: Optional[UUID] = None,
+    chat_id: Optional[UUID4] = None,
+    group_id: Optional[UUID4] = None,
     action: ChatAction = Query(..., description="Specify the action to perform."),
     message_id: Optional[UUID] = None,
     emoji: Optional[str] = None,
@@ -146,7 +147,13 @@ def message_handler(
     if action == ChatAction.send:
         if not message_data:
             raise HTTPException(status_code=422, detail="message_data is required for send")
-        return crud.send_message(db, current_user.id, schemas.MessageCreate(
+        if not chat_id and not group_id:
+            raise HTTPException(status_code=422, detail="Either 'chat_id' or 'group_id' must be provided.")
+        if chat_id and group_id:
+            raise HTTPException(status_code=422, detail="Only one of 'chat_id' or 'group_id' should be provided.")
+        # chat_id/group_id are typed UUID4 and message_data shares MessageCreate's field types,
+        # so together with the checks above this covers everything MessageCreate validates
+        return crud.send_message(db, current_user.id, schemas.MessageCreate.model_construct(
             chat_id=chat_id,
             group_id=group_id,
             content=message_data.content,
@@ -9,4 +9,4 @@ router = APIRouter(
 @router.get("/country-codes")
 def get_country_codes():
     """Return a list of supported country codes with display names and formatting examples"""
-    return CountryPhoneData().get_all_country_codes()
+    return CountryPhoneData.get_all_country_codes()
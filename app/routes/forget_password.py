@@ -12,9 +12,9 @@ router = APIRouter(
 
 @router.post("/forgot", response_model=schemas.OTPResponse)
 def forgot_password(request: schemas.ForgotPasswordRequest, db: Session = Depends(get_db)):
-    login_id = request.login_id.strip()
+    login_id = request.login_id
 
-    if login_id.isdigit():
+    if request.login_kind == "phone":
         users = crud.get_users_by_phone(db, login_id)
         if not users:
             raise HTTPException(status_code=404, detail="No users linked to this phone number")
@@ -95,7 +95,7 @@ def verify_otp_and_list_users(
     return {"usernames": [u.username for u in users]}
 
 
-@router.post("/reset", response_model=schemas.MessageResponse)
+@router.post("/reset", response_model=schemas.GenericMessageResponse)
 def reset_password(request: schemas.ResetPasswordRequest, db: Session = Depends(get_db)):
     user = crud.get_user_by_username(db, request.username)
     if not user:
@@ -19,8 +19,8 @@ def login_user(
 ):
     """Log in using username or phone number"""
 
-    # Normalize phone number if used
-    login_id = login_request.login_id.replace(" ", "")
+    # Already trimmed and validated, so it holds no spaces
+    login_id = login_request.login_id
 
     # Fetch most appropriate user based on logic (most recent if phone is used)
     user = crud.get_user_by_login_id(db, login_id, login_request.password)
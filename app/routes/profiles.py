@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Header, Response, status
 from sqlalchemy.orm import Session
+from sqlalchemy import or_
 
 from .. import crud, models, schemas
 from ..database import get_db
@@ -7,7 +8,9 @@ from ..auth import get_current_user
 from ..s3 import upload_image_to_s3, delete_image_from_s3
 from ..schemas import UserProfilePublicResponse, UserProfileResponse, CountryPhoneData
 import uuid
+import hashlib
 from datetime import datetime, timedelta
+from typing import Optional
 import os
 
 FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:3000")  # fallback for local dev
@@ -18,61 +21,28 @@ router = APIRouter(
     responses={404: {"description": "Not found"}}
 )
 
-@router.get("/by-username/{username}", response_model=UserProfilePublicResponse)
-async def get_user_profile_by_username(
-    username: str,
-    current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
-    db_user = crud.get_user_by_username(db, username)
-    if not db_user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    db_profile = crud.get_user_profile(db, db_user.id)
-    if not db_profile:
-        raise HTTPException(status_code=404, detail="Profile not found")
-
-    # Compute age
-    age = db_user.age
-
-    # Count total connections (user can be in either side)
-    connection_count = db.query(models.Connection).filter(
-        (models.Connection.user_id1 == db_user.id) |
-        (models.Connection.user_id2 == db_user.id)
-    ).count()
-
-    # Count posts
-    post_count = db.query(models.Post).filter(models.Post.user_id == db_user.id).count()
-
-    # Compose base fields
-    base_data = {
-        "id": db_profile.id,
-        "username": db_profile.username,
-        "display_name": db_profile.display_name,
-        "profile_image_url": db_profile.profile_image_url,
-        "location": db_profile.location,
-        "age": age,
-        "connection_count": connection_count,
-        "post_count": post_count
-    }
-
-    if db_user.id == current_user.id or crud.check_users_connected(db, current_user.id, db_user.id):
-        return schemas.UserProfileResponse(
-            **base_data,
-            bio=db_profile.bio,
-            user_id=db_profile.user_id,
-            created_at=db_profile.created_at,
-            updated_at=db_profile.updated_at,
-        )
+PROFILE_CACHE_CONTROL = "private, max-age=30"
 
-    if crud.is_blocked_relation(db, current_user.id, db_user.id):
-        raise HTTPException(status_code=404, detail="User not found or blocked")
+def _profile_etag(profile: models.UserProfile, *extra) -> str:
+    """Build an ETag from the profile's last update plus any computed fields in the payload"""
+    raw = ":".join(str(part) for part in (profile.updated_at, profile.profile_image_url, *extra))
+    return f'"{hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()}"'
 
-    return schemas.UserProfilePublicResponse(**base_data)
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match uses weak comparison: '*' or any listed tag, with or without W/, matches"""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
 
 @router.get("/by-username/{username}", response_model=UserProfilePublicResponse)
 async def get_user_profile_by_username(
     username: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     current_user: models.User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -84,19 +54,16 @@ async def get_user_profile_by_username(
     if not db_profile:
         raise HTTPException(status_code=404, detail="Profile not found")
 
-    # Blocked user cannot see blocker's profile
-    if crud.is_blocked_relation(db, db_user.id, current_user.id):
-        # If current_user is blocked by db_user → hide profile
-        raise HTTPException(status_code=404, detail="User not found")
+    is_full_profile = db_user.id == current_user.id or crud.check_users_connected(db, current_user.id, db_user.id)
 
-    # 👤 Blocker CAN view the blocked user (no restriction)
+    # Self and connections always get the full profile; otherwise a block in
+    # either direction (blocker or blocked) hides the profile
+    if not is_full_profile and crud.is_blocked_relation(db, current_user.id, db_user.id):
+        raise HTTPException(status_code=404, detail="User not found or blocked")
 
     # Compute stats
     age = db_user.age
-    connection_count = db.query(models.Connection).filter(
-        (models.Connection.user_id1 == db_user.id) |
-        (models.Connection.user_id2 == db_user.id)
-    ).count()
+    connection_count = crud.count_user_connections(db, db_user.id)
     post_count = db.query(models.Post).filter(models.Post.user_id == db_user.id).count()
 
     base_data = {
@@ -110,7 +77,14 @@ async def get_user_profile_by_username(
         "post_count": post_count
     }
 
-    if db_user.id == current_user.id or crud.check_users_connected(db, current_user.id, db_user.id):
+    # Let clients that already hold this exact payload skip the body
+    etag = _profile_etag(db_profile, age, connection_count, post_count, is_full_profile)
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": PROFILE_CACHE_CONTROL})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = PROFILE_CACHE_CONTROL
+
+    if is_full_profile:
         return schemas.UserProfileResponse(
             **base_data,
             bio=db_profile.bio,
@@ -134,35 +108,23 @@ async def upload_profile_image(
 
     if profile.profile_image_url:
         try:
-            delete_image_from_s3(profile.profile_image_url)
+            await delete_image_from_s3(profile.profile_image_url)
         except Exception:
             pass
 
-    image_url = await upload_image_to_s3(file, folder=f"user-profile/{current_user.id}")
+    image_url = await upload_image_to_s3(file, user_id=current_user.id)
     profile.profile_image_url = image_url
     db.commit()
     db.refresh(profile)
 
-    connection_count = db.query(models.Connection).filter(
-        (models.Connection.user_id1 == current_user.id) |
-        (models.Connection.user_id2 == current_user.id)
-    ).count()
+    connection_count = crud.count_user_connections(db, current_user.id)
     post_count = db.query(models.Post).filter(models.Post.user_id == current_user.id).count()
 
-    return schemas.UserProfileResponse(
-        id=profile.id,
-        username=profile.username,
-        display_name=profile.display_name,
-        profile_image_url=profile.profile_image_url,
-        age=current_user.age,
-        location=profile.location,
-        bio=profile.bio,
-        user_id=profile.user_id,
-        created_at=profile.created_at,
-        updated_at=profile.updated_at,
-        connection_count=connection_count,
-        post_count=post_count,
-    )
+    response = schemas.UserProfileResponse.model_validate(profile)
+    response.age = current_user.age
+    response.connection_count = connection_count
+    response.post_count = post_count
+    return response
 
 @router.delete("/by-username/{username}/image", response_model=UserProfileResponse)
 async def delete_profile_image_by_username(
@@ -184,20 +146,11 @@ async def delete_profile_image_by_username(
     if not db_profile.profile_image_url:
         raise HTTPException(status_code=400, detail="No profile image to delete")
 
-    delete_image_from_s3(db_profile.profile_image_url)
+    await delete_image_from_s3(db_profile.profile_image_url)
     updated_profile = crud.update_profile_image_url(db, db_user.id, None)
-    return schemas.UserProfileResponse(
-        id=updated_profile.id,
-        username=updated_profile.username,
-        display_name=updated_profile.display_name,
-        profile_image_url=updated_profile.profile_image_url,
-        age=db_user.age,
-        location=updated_profile.location,
-        bio=updated_profile.bio,
-        user_id=updated_profile.user_id,
-        created_at=updated_profile.created_at,
-        updated_at=updated_profile.updated_at,
-    )
+    response = schemas.UserProfileResponse.model_validate(updated_profile)
+    response.age = db_user.age
+    return response
 
 @router.post("/share-profile", response_model=schemas.SharedProfileResponse)
 def generate_profile_share_link(
@@ -220,13 +173,32 @@ def generate_profile_share_link(
     return {"token": token, "share_url": share_url}
 
 @router.get("/view-profile/{token}", response_model=schemas.UserProfilePublicResponse)
-def view_shared_profile(token: str, db: Session = Depends(get_db)):
-    share = db.query(models.SharedProfileToken).filter_by(token=token, is_active=True).first()
-    if not share or (share.expires_at and share.expires_at < datetime.utcnow()):
+def view_shared_profile(
+    token: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
+    share = db.query(models.SharedProfileToken).filter(
+        models.SharedProfileToken.token == token,
+        models.SharedProfileToken.is_active == True,
+        or_(
+            models.SharedProfileToken.expires_at == None,
+            models.SharedProfileToken.expires_at > datetime.utcnow()
+        )
+    ).first()
+    if not share:
         raise HTTPException(status_code=404, detail="Invalid or expired link")
 
     user = db.query(models.User).filter_by(id=share.user_id).first()
     profile = crud.get_user_profile(db, user.id)
+
+    etag = _profile_etag(profile, user.age)
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": PROFILE_CACHE_CONTROL})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = PROFILE_CACHE_CONTROL
+
     return schemas.UserProfilePublicResponse(
         id=profile.id,
         username=profile.username,
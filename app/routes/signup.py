@@ -1,8 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import Optional
-from datetime import datetime
-from .. import schemas, crud, auth, otp, models
+from .. import schemas, crud, auth, otp
 from ..database import get_db
 from fastapi.responses import JSONResponse
 
@@ -41,17 +40,14 @@ def request_signup_otp(
         "expires_at": new_otp.expires_at
     }
 
-@router.post("/verify-otp", response_model=schemas.MessageResponse)
+@router.post("/verify-otp", response_model=schemas.GenericMessageResponse)
 def verify_signup_otp(
     request: schemas.SignupOTPVerificationRequest,
     db: Session = Depends(get_db)
 ):
     """Verify OTP for signup process"""
     # Get latest unexpired OTP (assume phone is remembered from previous step)
-    latest_otp = db.query(models.OTP).filter(
-        models.OTP.purpose == "signup",
-        models.OTP.expires_at > datetime.utcnow()
-    ).order_by(models.OTP.created_at.desc()).first()
+    latest_otp = crud.get_latest_signup_otp(db)
 
     if not latest_otp:
         raise HTTPException(status_code=404, detail="No OTP found")
@@ -84,11 +80,7 @@ def complete_signup(
         )
 
     # Find the latest verified OTP that hasn't expired
-    verified_otp = db.query(models.OTP).filter(
-        models.OTP.purpose == "signup",
-        models.OTP.is_verified == True,
-        models.OTP.expires_at > datetime.utcnow()
-    ).order_by(models.OTP.created_at.desc()).first()
+    verified_otp = crud.get_latest_signup_otp(db, verified_only=True)
 
     if not verified_otp:
         raise HTTPException(
@@ -10,7 +10,7 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-@router.patch("/", response_model=schemas.MessageResponse)
+@router.patch("/", response_model=schemas.GenericMessageResponse)
 def update_theme(
     theme_data: schemas.ThemeUpdateRequest,
     current_user: models.User = Depends(auth.get_current_user),
@@ -28,7 +28,7 @@ def update_theme(
     return {"message": f"Theme updated to {theme_data.theme.value}"}
 
 
-# @router.get("/", response_model=schemas.MessageResponse)
+# @router.get("/", response_model=schemas.GenericMessageResponse)
 # def get_theme(
 #     current_user: models.User = Depends(auth.get_current_user)
 # ):
@@ -1,9 +1,8 @@
-import boto3
+import asyncio
 import uuid
 from fastapi import UploadFile, HTTPException
 import os
 from typing import Optional
-from botocore.exceptions import ClientError
 
 # Load AWS credentials from environment variables
 AWS_ACCESS_KEY = os.getenv("AWS_ACCESS_KEY")
@@ -11,22 +10,58 @@ AWS_SECRET_KEY = os.getenv("AWS_SECRET_KEY")
 AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
 S3_BUCKET = os.getenv("S3_BUCKET_NAME")
 
-# Initialize S3 client
-s3_client = boto3.client(
-    "s3",
-    aws_access_key_id=AWS_ACCESS_KEY,
-    aws_secret_access_key=AWS_SECRET_KEY,
-    region_name=AWS_REGION
-)
+# boto3/botocore are slow to import, so the client is built on first use, not at startup
+s3_client = None
+TRANSFER_CONFIG = None
 
 
-def validate_image_file(file: UploadFile) -> bool:
+def _get_s3():
+    """Return the shared S3 client, creating it (and TRANSFER_CONFIG) on first call"""
+    global s3_client, TRANSFER_CONFIG
+    if s3_client is None:
+        import boto3
+        from boto3.s3.transfer import TransferConfig
+        from botocore.config import Config
+
+        # Stream uploads in 8 MB parts; larger files go multipart with parts sent in parallel
+        TRANSFER_CONFIG = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=8 * 1024 * 1024,
+            max_concurrency=8
+        )
+        # The pool must cover concurrent uploads times TRANSFER_CONFIG.max_concurrency;
+        # virtual-hosted addressing matches the URLs we hand out and parse back
+        s3_client = boto3.client(
+            "s3",
+            aws_access_key_id=AWS_ACCESS_KEY,
+            aws_secret_access_key=AWS_SECRET_KEY,
+            region_name=AWS_REGION,
+            config=Config(
+                max_pool_connections=64,
+                tcp_keepalive=True,
+                retries={"max_attempts": 3, "mode": "adaptive"},
+                s3={"addressing_style": "virtual"}
+            )
+        )
+    return s3_client
+
+
+JPEG_SIGNATURE = b"\xff\xd8\xff"
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Allowed content types and the extension their S3 keys get
+EXT_FROM_CONTENT_TYPE = {"image/jpeg": ".jpg", "image/png": ".png"}
+
+# The magic bytes each allowed content type must start with
+SIGNATURE_FROM_CONTENT_TYPE = {"image/jpeg": JPEG_SIGNATURE, "image/png": PNG_SIGNATURE}
+
+
+async def validate_image_file(file: UploadFile) -> bool:
     """Validate that the uploaded file is a JPEG or PNG image."""
-    allowed_content_types = ["image/jpeg", "image/png"]
-    allowed_extensions = [".jpeg", ".jpg", ".png"]
+    allowed_extensions = (".jpeg", ".jpg", ".png")
     
     # Check content type
-    if file.content_type not in allowed_content_types:
+    if file.content_type not in EXT_FROM_CONTENT_TYPE:
         return False
     
     # Check file extension
@@ -34,6 +69,13 @@ def validate_image_file(file: UploadFile) -> bool:
     if file_ext not in allowed_extensions:
         return False
     
+    # Check the file signature from a small peek, then rewind for the upload.
+    # It must match the declared type, since the S3 key extension and ContentType come from it
+    head = await file.read(12)
+    await file.seek(0)
+    if not head.startswith(SIGNATURE_FROM_CONTENT_TYPE[file.content_type]):
+        return False
+    
     return True
 
 
@@ -52,23 +94,27 @@ async def upload_image_to_s3(file: UploadFile, user_id: int) -> str:
         HTTPException: If the file is invalid or upload fails
     """
     # Validate image
-    if not validate_image_file(file):
+    if not await validate_image_file(file):
         raise HTTPException(status_code=400, detail="Invalid image format. Only JPEG and PNG are allowed.")
     
+    from botocore.exceptions import ClientError
+    
     try:
-        # Generate a unique file name
-        file_extension = os.path.splitext(file.filename)[1].lower() if file.filename else ".jpg"
-        unique_filename = f"profile-images/{user_id}/{uuid.uuid4()}{file_extension}"
+        # Resolve the client on the event loop thread so worker threads never race to create it
+        client = _get_s3()
         
-        # Read file content
-        file_content = await file.read()
+        # Generate a unique file name; the extension follows the validated content type
+        file_extension = EXT_FROM_CONTENT_TYPE[file.content_type]
+        unique_filename = f"profile-images/{user_id}/{uuid.uuid4().hex}{file_extension}"
         
-        # Upload to S3
-        s3_client.put_object(
-            Bucket=S3_BUCKET,
-            Key=unique_filename,
-            Body=file_content,
-            ContentType=file.content_type
+        # Stream the spooled upload to S3 from a worker thread
+        await asyncio.to_thread(
+            client.upload_fileobj,
+            file.file,
+            S3_BUCKET,
+            unique_filename,
+            ExtraArgs={"ContentType": file.content_type},
+            Config=TRANSFER_CONFIG
         )
         
         # Generate URL
@@ -81,7 +127,7 @@ async def upload_image_to_s3(file: UploadFile, user_id: int) -> str:
         raise HTTPException(status_code=500, detail=f"Error uploading file: {str(e)}")
 
 
-def delete_image_from_s3(image_url: str) -> bool:
+async def delete_image_from_s3(image_url: str) -> bool:
     """
     Delete image from S3 bucket
     
@@ -94,17 +140,20 @@ def delete_image_from_s3(image_url: str) -> bool:
     Raises:
         HTTPException: If deletion fails
     """
+    from botocore.exceptions import ClientError
+    
     try:
+        client = _get_s3()
+        
         # Extract the key (filename) from the URL
         # URL format: https://bucket-name.s3.region.amazonaws.com/path/to/file
-        parts = image_url.split(".amazonaws.com/")
-        if len(parts) != 2:
+        _, sep, key = image_url.partition(".amazonaws.com/")
+        if not sep or not key:
             raise HTTPException(status_code=400, detail="Invalid S3 URL format")
-            
-        key = parts[1]
         
-        # Delete the file from S3
-        s3_client.delete_object(
+        # Delete the file from S3 without blocking the event loop
+        await asyncio.to_thread(
+            client.delete_object,
             Bucket=S3_BUCKET,
             Key=key
         )
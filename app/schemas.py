@@ -1,14 +1,104 @@
-from pydantic import BaseModel, EmailStr, Field, validator, HttpUrl, ConfigDict, UUID4, model_validator
-from typing import Dict, Optional, List, Union, Tuple, Literal
+from pydantic import BaseModel, EmailStr, Field, field_validator, HttpUrl, ConfigDict, UUID4, model_validator, constr, AfterValidator, ValidationInfo
+from typing import Annotated, Dict, NamedTuple, Optional, List, Tuple, Literal
 from datetime import date, datetime
+import hmac
 import re
 from .models import Gender, Sexuality, Theme, LoginType, AccountType
 from enum import Enum
+from types import MappingProxyType
+from functools import lru_cache
 from uuid import UUID
 
+# Compiled once at import; validators run on every request body
+_FORGOT_USERNAME_RE = re.compile(r'^[a-z0-9_.]{3,20}$')
+# E.164 phone or username in one pass; the alternatives are disjoint on the leading '+'
+_LOGIN_ID_RE = re.compile(r'^(?:\+[1-9]\d{1,3}\d{10}|[a-z0-9_\.]+)$')
+# Plain pattern strings go to Field/constr(pattern=...) so pydantic-core runs them with its
+# Rust engine; a compiled re.Pattern there would fall back to Python. Compile with re only
+# for Python-side validators.
+_E164_PATTERN = r'^\+[1-9]\d{1,3}\d{10}$'  # exactly 10 digits after the country code
+_USERNAME_PATTERN = r'^[a-z0-9_.]*[a-z][a-z0-9_.]*$'  # lowercase, at least one letter
+_OTP_PATTERN = r'^\d{6}$'
+_NAME_PATTERN = r'^[A-Za-z]+$'
+_URL_PATTERN = r'^https?://.+\..+'
+# Constrained strings are checked inside pydantic-core, with no Python validator call.
+UsernameStr = constr(min_length=3, max_length=20, pattern=_USERNAME_PATTERN)
+# max_length is checked before the pattern, so the regex only ever sees short input
+OTPCodeStr = constr(max_length=6, pattern=_OTP_PATTERN)
+NameStr = constr(pattern=_NAME_PATTERN)  # ASCII letters only
+OAuthProviderStr = constr(to_lower=True, pattern=r'^(?i:google|apple)$')
+E164PhoneStr = constr(max_length=16, pattern=_E164_PATTERN)
+# Trimmed per field rather than per model, so passwords beside it are never stripped
+LoginIdStr = constr(strip_whitespace=True)
+
+MIN_USER_AGE = 13
+
+
+@lru_cache(maxsize=1)
+def _latest_dob_for_min_age(today_ordinal: int) -> date:
+    """Latest date of birth that is MIN_USER_AGE years old on the given day, cached per day"""
+    today = date.fromordinal(today_ordinal)
+    try:
+        return today.replace(year=today.year - MIN_USER_AGE)
+    except ValueError:
+        # Feb 29 with no leap day in the birth year: only Feb 28 births have had their birthday
+        return today.replace(year=today.year - MIN_USER_AGE, day=28)
+
+PASSWORD_MAX_LENGTH = 128
+
+# A valid password passes in one match; the per-class scan below only builds the error message
+_PASSWORD_RE = re.compile(r'(?=.*[A-Z])(?=.*[a-z])(?=.*\d)(?=.*[!@#$%^&*(),.?":{}|<>]).{8}', re.DOTALL)
+_PW_UPPER = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+_PW_LOWER = frozenset('abcdefghijklmnopqrstuvwxyz')
+_PW_SPECIAL = frozenset('!@#$%^&*(),.?":{}|<>')
+
+
+def _missing_password_class(password: str) -> Optional[str]:
+    """Name the first required character class a password lacks"""
+    # Set intersection runs in C; digits use isdecimal() to match the regex's \d
+    if _PW_UPPER.isdisjoint(password):
+        return 'uppercase letter'
+    if _PW_LOWER.isdisjoint(password):
+        return 'lowercase letter'
+    if not any(map(str.isdecimal, password)):
+        return 'digit'
+    if _PW_SPECIAL.isdisjoint(password):
+        return 'special character'
+    return None
+
+
+def _check_password(v: str) -> str:
+    # Length is O(1); reject short input before any scan (the upper bound is on PasswordStr)
+    if len(v) < 8:
+        raise ValueError('Password must be at least 8 characters long')
+    if _PASSWORD_RE.match(v):
+        return v
+    # Slow path: work out which class is missing
+    raise ValueError(f'Password must contain at least one {_missing_password_class(v)}')
+
+# Shared by every model that sets a password, so the rule lives in one validator
+PasswordStr = Annotated[str, Field(max_length=PASSWORD_MAX_LENGTH), AfterValidator(_check_password)]
+
+
+def _secrets_equal(a: str, b: str) -> bool:
+    """Constant-time comparison; compare_digest only takes ASCII str, so compare the UTF-8 bytes"""
+    return hmac.compare_digest(a.encode(), b.encode())
+
+
+class _PhoneCleanTable(dict):
+    """str.translate table that keeps digits and '+' and deletes everything else"""
 
-class PhoneValidationResult(BaseModel):
-    """Response model for phone validation results"""
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        # Non-ASCII characters are rare here; decide them on the fly (same digits as regex \d)
+        return codepoint if chr(codepoint).isdecimal() else None
+
+_PHONE_CLEAN_TABLE = _PhoneCleanTable(
+    (codepoint, codepoint if chr(codepoint) in "0123456789+" else None) for codepoint in range(128)
+)
+
+
+class PhoneValidationResult(NamedTuple):
+    """Phone validation outcome; internal only, so a plain tuple instead of a validated model"""
     is_valid: bool
     message: str
     formatted_number: Optional[str] = None
@@ -23,7 +113,7 @@ class CountryPhoneData:
         # North America
         "1": {
             "country": "United States/Canada",
-            "pattern": r"^[2-9]\d{9}$",  # Excludes area codes starting with 0 or 1
+            "pattern": r"^(?!911)[2-9]\d{9}$",  # Excludes area codes starting with 0 or 1, and 911
             "display": "(XXX) XXX-XXXX",
             "min_length": 10,
             "max_length": 10,
@@ -121,66 +211,108 @@ class CountryPhoneData:
 
     }
     
-    def __init__(self):
-        # Merge additional countries into the main database
-        self.COUNTRY_PHONE_DATA.update(self.ADDITIONAL_COUNTRIES)
-    
-    def get_country_data(self, country_code: str) -> Dict:
+    @classmethod
+    def get_country_data(cls, country_code: str) -> Dict:
         """Get validation data for a specific country code"""
-        return self.COUNTRY_PHONE_DATA.get(str(country_code), self.COUNTRY_PHONE_DATA["default"])
+        return cls.COUNTRY_PHONE_DATA.get(country_code, cls.COUNTRY_PHONE_DATA["default"])
 
-    def get_all_country_codes(self) -> List[Dict]:
+    @classmethod
+    def get_all_country_codes(cls) -> Tuple[Dict, ...]:
         """Get all available country codes for dropdown population"""
-        return [
-            {
-                "code": code,
-                "name": data.get("country", f"Country code +{code}"),
-                "example": data.get("display", None)
-            }
-            for code, data in self.COUNTRY_PHONE_DATA.items()
-            if code != "default"
-        ]
+        return _ALL_COUNTRY_CODES
     
-    def format_phone_number(self, country_code: str, phone_number: str) -> str:
+    @staticmethod
+    def format_phone_number(country_code: str, phone_number: str) -> str:
         """Format a phone number according to the country's display format"""
-        country_data = self.get_country_data(str(country_code))
-        display_format = country_data.get("display")
-        
-        # If no format is provided, return with basic formatting
-        if not display_format:
-            return f"+{country_code} {phone_number}"
-        
-        # Format based on country code
-        if country_code == "1":  # US/Canada: (XXX) XXX-XXXX
-            return f"+{country_code} ({phone_number[:3]}) {phone_number[3:6]}-{phone_number[6:]}"
-        
-        elif country_code == "44":  # UK: XXXX XXXXXX
-            if len(phone_number) == 10:
-                return f"+{country_code} {phone_number[:4]} {phone_number[4:]}"
-            else:
-                return f"+{country_code} {phone_number[:5]} {phone_number[5:]}"
-        
-        elif country_code == "91":  # India: XXXXX XXXXX
-            return f"+{country_code} {phone_number[:5]} {phone_number[5:]}"
-        
-        else:
-            # Generic formatting based on length
-            if len(phone_number) <= 8:
-                return f"+{country_code} {phone_number[:4]} {phone_number[4:]}"
-            else:
-                return f"+{country_code} {phone_number[:5]} {phone_number[5:]}"
+        return _FORMATTERS.get(country_code, _format_plain)(country_code, phone_number)
+
+
+# Merge additional countries into a read-only view once at import
+CountryPhoneData.COUNTRY_PHONE_DATA = MappingProxyType(
+    {**CountryPhoneData.COUNTRY_PHONE_DATA, **CountryPhoneData.ADDITIONAL_COUNTRIES}
+)
+
+# Validation rules flattened per code: (compiled pattern, min_length, max_length, country name).
+# re.ASCII keeps \d to [0-9]; every pattern is anchored and encodes the
+# country's min/max length, so a single match covers both checks.
+_CC_TABLE = MappingProxyType({
+    code: (
+        re.compile(data["pattern"], re.ASCII),
+        data.get("min_length", 6),
+        data.get("max_length", 15),
+        data.get("country", "this country"),
+    )
+    for code, data in CountryPhoneData.COUNTRY_PHONE_DATA.items()
+})
+
+# The country table is static, so the dropdown list is built once
+_ALL_COUNTRY_CODES = tuple(
+    {
+        "code": code,
+        "name": data.get("country", f"Country code +{code}"),
+        "example": data.get("display", None)
+    }
+    for code, data in CountryPhoneData.COUNTRY_PHONE_DATA.items()
+    if code != "default"
+)
+
+# Country codes bucketed by length (1-3 digits) for prefix lookups
+_CODES_BY_LEN = {
+    length: frozenset(code for code in CountryPhoneData.COUNTRY_PHONE_DATA if len(code) == length)
+    for length in (1, 2, 3)
+}
+
+
+# Display formatters, resolved per code once instead of walking an if/elif chain per call
+def _format_plain(country_code: str, phone_number: str) -> str:
+    return f"+{country_code} {phone_number}"
+
+def _format_generic(country_code: str, phone_number: str) -> str:
+    split = 4 if len(phone_number) <= 8 else 5
+    return f"+{country_code} {phone_number[:split]} {phone_number[split:]}"
+
+def _format_nanpa(country_code: str, phone_number: str) -> str:
+    """US/Canada: (XXX) XXX-XXXX"""
+    return f"+{country_code} ({phone_number[:3]}) {phone_number[3:6]}-{phone_number[6:]}"
+
+def _format_uk(country_code: str, phone_number: str) -> str:
+    """UK: XXXX XXXXXX"""
+    split = 4 if len(phone_number) == 10 else 5
+    return f"+{country_code} {phone_number[:split]} {phone_number[split:]}"
+
+def _format_in(country_code: str, phone_number: str) -> str:
+    """India: XXXXX XXXXX"""
+    return f"+{country_code} {phone_number[:5]} {phone_number[5:]}"
+
+# Codes without a display format get the basic "+CC number" form
+_FORMATTERS = {
+    code: _format_generic if data.get("display") else _format_plain
+    for code, data in CountryPhoneData.COUNTRY_PHONE_DATA.items()
+}
+_FORMATTERS.update({"1": _format_nanpa, "44": _format_uk, "91": _format_in})
+
+
+def _phone_mismatch_message(length: int, min_length: int, max_length: int, country: str) -> str:
+    """Explain why a local number failed its country pattern; only called on the failing path"""
+    if length < min_length:
+        return f"Phone number is too short for {country}. Minimum length: {min_length}"
+    if length > max_length:
+        return f"Phone number is too long for {country}. Maximum length: {max_length}"
+    return f"Invalid phone number format for {country}"
+
+
+# Full "+CC number" input: at most 18 digits plus the '+', with generous room for separators.
+# Anything longer is rejected before it is cleaned and parsed.
+PHONE_FULL_INPUT_MAX_LENGTH = 32
 
 
 class PhoneValidator:
     """Phone number validator with country-specific validation"""
     
-    def __init__(self):
-        self.country_data = CountryPhoneData()
-    
     def parse_phone_number(self, phone: str) -> Tuple[str, str]:
         """Parse a phone number into country code and local number"""
         # Remove any non-numeric characters except the leading +
-        clean_phone = re.sub(r'[^\d+]', '', phone)
+        clean_phone = phone.translate(_PHONE_CLEAN_TABLE)
         
         if not clean_phone.startswith('+'):
             raise ValueError("Phone number must start with a '+' followed by the country code")
@@ -188,11 +320,10 @@ class PhoneValidator:
         # Remove the + sign
         clean_phone = clean_phone[1:]
         
-        # Try to extract country code
-        # First check for 3-digit country codes
-        for i in range(1, 4):
+        # Try to extract country code, longest match first
+        for i in (3, 2, 1):
             potential_code = clean_phone[:i]
-            if potential_code in self.country_data.COUNTRY_PHONE_DATA:
+            if potential_code in _CODES_BY_LEN[i]:
                 return potential_code, clean_phone[i:]
         
         # If no country code found, assume it's invalid
@@ -203,70 +334,66 @@ class PhoneValidator:
         if phone is None:
             return PhoneValidationResult(is_valid=False, message="Phone number cannot be empty")
         
+        if len(phone) > PHONE_FULL_INPUT_MAX_LENGTH:
+            return PhoneValidationResult(is_valid=False, message="Phone number is too long")
+        
         try:
             # Parse the phone number
             country_code, local_number = self.parse_phone_number(phone)
-            
-            # Get country-specific validation rules
-            country_data = self.country_data.get_country_data(str(country_code))
-            
-            # Check length constraints
-            min_length = country_data.get("min_length", 6)
-            max_length = country_data.get("max_length", 15)
-            
-            if len(local_number) < min_length:
-                return PhoneValidationResult(
-                    is_valid=False,
-                    message=f"Phone number is too short for {country_data.get('country', 'this country')}. "
-                           f"Minimum length: {min_length}"
-                )
-            
-            if len(local_number) > max_length:
-                return PhoneValidationResult(
-                    is_valid=False,
-                    message=f"Phone number is too long for {country_data.get('country', 'this country')}. "
-                           f"Maximum length: {max_length}"
-                )
-            
-            # Check pattern
-            pattern = country_data.get("pattern")
-            if pattern and not re.match(pattern, local_number):
-                return PhoneValidationResult(
-                    is_valid=False,
-                    message=f"Invalid phone number format for {country_data.get('country', 'this country')}"
-                )
-            
-            # Special case validations for specific countries
-            if country_code == "1":
-                # North American Numbering Plan validation
-                area_code = local_number[:3]
-                if area_code in ["000", "911"]:
-                    return PhoneValidationResult(is_valid=False, message="Invalid area code")
-            
-            if country_code == "44" and local_number.startswith("0"):
-                return PhoneValidationResult(
-                    is_valid=False,
-                    message="UK numbers should not start with 0 when using country code"
-                )
-            
-            if country_code == "91" and not any(local_number.startswith(digit) for digit in ["6", "7", "8", "9"]):
-                return PhoneValidationResult(
-                    is_valid=False,
-                    message="Indian mobile numbers must start with 6, 7, 8, or 9"
-                )
-            
-            # Format the phone number
-            formatted_number = self.country_data.format_phone_number(country_code, local_number)
-            
-            # If all checks pass, the number is valid
-            return PhoneValidationResult(
-                is_valid=True,
-                message="Valid phone number",
-                formatted_number=formatted_number
-            )
-            
         except ValueError as e:
             return PhoneValidationResult(is_valid=False, message=str(e))
+        
+        return self._validate_local(country_code, local_number)
+    
+    def validate_components(self, country_code: str, local_number: str) -> PhoneValidationResult:
+        """Validate a local number whose country code is already known, skipping the prefix lookup"""
+        if country_code not in _CODES_BY_LEN.get(len(country_code), ()):
+            return PhoneValidationResult(is_valid=False, message="Invalid country code")
+        
+        return self._validate_local(country_code, local_number.translate(_PHONE_CLEAN_TABLE))
+    
+    def _validate_local(self, country_code: str, local_number: str) -> PhoneValidationResult:
+        """Check a cleaned local number against its country's rules"""
+        # Get country-specific validation rules; callers only pass known codes
+        pattern, min_length, max_length, country = _CC_TABLE[country_code]
+        
+        # Check pattern (length included); lengths are only inspected to explain a failure
+        if not pattern.match(local_number):
+            return PhoneValidationResult(
+                is_valid=False,
+                message=_phone_mismatch_message(len(local_number), min_length, max_length, country)
+            )
+        
+        # Format the phone number
+        formatted_number = _FORMATTERS[country_code](country_code, local_number)
+        
+        # If all checks pass, the number is valid
+        return PhoneValidationResult(
+            is_valid=True,
+            message="Valid phone number",
+            formatted_number=formatted_number
+        )
+
+
+# Shared by every phone_number validator below
+_PHONE_VALIDATOR = PhoneValidator()
+
+
+def _check_local_phone(v: str, info: ValidationInfo) -> str:
+    """Validate a local phone_number against the model's country_code field"""
+    country_code = info.data.get('country_code')
+    if not country_code:
+        raise ValueError('country_code is required for phone validation')
+
+    result = _PHONE_VALIDATOR.validate_components(country_code, v)
+    if not result.is_valid:
+        raise ValueError(result.message)
+    return v
+
+# Local number validated against a country_code field declared before it.
+# 15 digits at most, plus room for the spaces/dashes parse_phone_number strips.
+PHONE_INPUT_MAX_LENGTH = 20
+PhoneStr = Annotated[str, Field(max_length=PHONE_INPUT_MAX_LENGTH), AfterValidator(_check_local_phone)]
 
 
 # Example Pydantic model with phone validation
@@ -275,13 +402,13 @@ class UserModel(BaseModel):
     # email: str
     phone_number: Optional[str] = None
     
-    @validator('phone_number')
+    @field_validator('phone_number')
+    @classmethod
     def validate_phone(cls, v):
         if v is None:
             return v
         
-        validator = PhoneValidator()
-        result = validator.validate_phone(v)
+        result = _PHONE_VALIDATOR.validate_phone(v)
         
         if not result.is_valid:
             raise ValueError(result.message)
@@ -293,197 +420,75 @@ class UserModel(BaseModel):
 # ---- Base Models ---- #
 class OTPBase(BaseModel):
     country_code: str
-    phone_number: str
+    phone_number: PhoneStr
     # email: Optional[EmailStr] = None
 
-    @validator('phone_number')
-    def validate_phone(cls, v, values):
-        country_code = str(values.get('country_code'))
-        if not country_code:
-            raise ValueError('country_code is required for phone validation')
-
-        validator = PhoneValidator()
-        full_phone = f"+{country_code}{v}"
-        result = validator.validate_phone(full_phone)
-
-        if not result.is_valid:
-            raise ValueError(result.message)
-
-        return v
-
-
-class UserBase(BaseModel):
-    username: str
-    first_name: str
-    last_name: str
-    # email: Optional[EmailStr] = None
-    country_code: str
-    phone_number: str
-    date_of_birth: date
-    gender: Gender
-    sexuality: Sexuality
-    theme: Theme
-
-    @validator('first_name', 'last_name')
-    def validate_names(cls, v):
-        if not re.match(r'^[A-Za-z]+$', v):
-            raise ValueError('Name must contain only alphabetic characters')
-        return v
-
-    @validator('username')
-    def validate_username(cls, v):
-        if not v.islower():
-            raise ValueError('Username must be lowercase')
-        if not re.match(r'^[a-z0-9_\.]+$', v):
-            raise ValueError('Username must contain only lowercase letters, numbers, underscores (_) or dots (.)')
-        if len(v) < 3 or len(v) > 20:
-            raise ValueError('Username must be between 3 and 20 characters')
-        return v
-
-    @validator('date_of_birth')
-    def validate_age(cls, v):
-        today = date.today()
-        age = today.year - v.year - ((today.month, today.day) < (v.month, v.day))
-        if age < 13:
-            raise ValueError('User must be at least 13 years old')
-        return v
-        
-    @validator('phone_number')
-    def validate_phone(cls, v, values):
-        country_code = str(values.get('country_code'))
-        if not country_code:
-            raise ValueError('country_code is required for phone validation')
-
-        validator = PhoneValidator()
-        full_phone = f"+{country_code}{v}"
-        result = validator.validate_phone(full_phone)
-
-        if not result.is_valid:
-            raise ValueError(result.message)
-
-        return v
 
 # ---- Request Models ---- #
 class PhoneVerificationRequest(BaseModel):
-    country_code: str
-    phone_number: str
-
-    @validator('phone_number')
-    def validate_phone(cls, v, values):
-        country_code = str(values.get('country_code'))
-        if not country_code:
-            raise ValueError("country_code is required to validate phone_number")
+    model_config = ConfigDict(str_strip_whitespace=True)
 
-        full_phone = f"+{country_code}{v}"
-        validator = PhoneValidator()
-        result = validator.validate_phone(full_phone)
-        if not result.is_valid:
-            raise ValueError(result.message)
-        return v
+    country_code: str
+    phone_number: PhoneStr
 
 
 class SignupOTPVerificationRequest(BaseModel):
-    otp_code: str
-
-    @validator('otp_code')
-    def validate_otp(cls, v):
-        if not re.match(r'^\d{6}$', v):
-            raise ValueError('OTP must be a 6-digit number')
-        return v
+    otp_code: OTPCodeStr
 
 # For forgot password flow (phone or username)
 class PasswordOTPVerificationRequest(BaseModel):
-    otp_code: str
-
-    @validator('otp_code')
-    def validate_otp(cls, v):
-        if not re.match(r'^\d{6}$', v):
-            raise ValueError('OTP must be a 6-digit number')
-        return v
+    otp_code: OTPCodeStr
 
 
 class UserCreateRequest(BaseModel):
-    username: str
-    first_name: str
-    last_name: str
+    username: UsernameStr
+    first_name: NameStr
+    last_name: NameStr
     date_of_birth: date
     gender: Gender
     sexuality: Sexuality
     theme: Theme
-    password: str
-    confirm_password: str
-    profile_picture_url: Optional[str] = None
+    password: PasswordStr
+    confirm_password: str = Field(exclude=True, repr=False)
+    profile_picture_url: Optional[str] = Field(None, pattern=_URL_PATTERN)
 
-    @validator('first_name', 'last_name')
-    def validate_names(cls, v):
-        if not re.match(r'^[A-Za-z]+$', v):
-            raise ValueError('Name must contain only alphabetic characters')
-        return v
-
-    @validator('username')
-    def validate_username(cls, v):
-        if not v.islower():
-            raise ValueError('Username must be lowercase')
-        if not re.match(r'^[a-z0-9_\.]+$', v):
-            raise ValueError('Username must contain only lowercase letters, numbers, underscores (_) or dots (.)')
-        if len(v) < 3 or len(v) > 20:
-            raise ValueError('Username must be between 3 and 20 characters')
-        return v
-
-    @validator('date_of_birth')
+    @field_validator('date_of_birth')
+    @classmethod
     def validate_age(cls, v):
-        today = date.today()
-        age = today.year - v.year - ((today.month, today.day) < (v.month, v.day))
-        if age < 13:
+        if v > _latest_dob_for_min_age(date.today().toordinal()):
             raise ValueError('User must be at least 13 years old')
         return v
 
-    @validator('password')
-    def validate_password(cls, v):
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        if not re.search(r'[A-Z]', v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not re.search(r'[a-z]', v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        if not re.search(r'\d', v):
-            raise ValueError('Password must contain at least one digit')
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', v):
-            raise ValueError('Password must contain at least one special character')
-        return v
 
-    @validator('confirm_password')
-    def passwords_match(cls, v, values, **kwargs):
-        if 'password' in values and v != values['password']:
+    @model_validator(mode="after")
+    def passwords_match(self):
+        if not _secrets_equal(self.password, self.confirm_password):
             raise ValueError('Passwords do not match')
-        return v
+        return self
 
-    @validator('profile_picture_url')
-    def validate_profile_url(cls, v):
-        if v is not None and not re.match(r'^https?://.+\..+', v):
-            raise ValueError('Invalid URL format for profile picture')
-        return v
 
 
+# Which identifier a validated login_id holds; routes branch on it instead of re-parsing the id
+LoginKind = Literal['phone', 'username']
 
 class LoginRequest(BaseModel):
-    login_id: str  # Can be phone, email, or username
+    login_id: LoginIdStr  # Can be phone, email, or username
     password: str
 
-    @validator('login_id')
+    @field_validator('login_id')
+    @classmethod
     def detect_login_format(cls, v):
-        # Phone number format validation (E.164 with exactly 10 digits after country code)
-        if re.match(r'^\+[1-9]\d{1,3}\d{10}$', v):
-            return v  # Valid phone number
+        # Phone number (E.164 with exactly 10 digits after country code) or
+        # username (lowercase, alphanumeric, and only _ or . as special chars)
+        if _LOGIN_ID_RE.match(v):
+            return v  # Valid phone number or username
         # # Email validation
         # elif re.match(r'^[\w\.-]+@[\w\.-]+\.\w+$', v):
         #     return v  # Valid email
-        # Username validation (lowercase, alphanumeric, and only _ or . as special chars)
-        elif re.match(r'^[a-z0-9_\.]+$', v):
-            return v  # Valid username
         raise ValueError('login_id must be a valid phone number (E.164 format) or username (lowercase with only _ or . as special characters)')
     
-    @validator('password')
+    @field_validator('password')
+    @classmethod
     def validate_password(cls, v):
         if len(v) < 8:
             raise ValueError('Password must be at least 8 characters long')
@@ -505,62 +510,42 @@ class LoginRequest(BaseModel):
 
 class OAuthLoginRequest(BaseModel):
     token: str
-    provider: str  # "google" or "apple"
-    
-    @validator('provider')
-    def validate_provider(cls, v):
-        valid_providers = ["google", "apple"]
-        if v.lower() not in valid_providers:
-            raise ValueError(f"Provider must be one of: {', '.join(valid_providers)}")
-        return v.lower()
+    provider: OAuthProviderStr  # "google" or "apple", any case
 
 class ForgotPasswordRequest(BaseModel):
-    login_id: str  # Accepts phone number or username
+    login_id: LoginIdStr  # Accepts phone number or username
 
-    @validator('login_id')
+    @field_validator('login_id')
+    @classmethod
     def detect_login_format(cls, v):
         if v.isdigit():
             if 6 <= len(v) <= 15:
                 return v  # Accept phone numbers of reasonable global length
             raise ValueError("Phone number must be between 6 and 15 digits")
-        elif re.match(r'^[a-z0-9_.]{3,20}$', v):
+        elif _FORGOT_USERNAME_RE.match(v):
             return v  # Valid username
         raise ValueError("login_id must be a valid phone number (digits only) or username (lowercase with _ or .)")
 
+    @property
+    def login_kind(self) -> LoginKind:
+        """Which identifier login_id holds; only a validated phone is all digits"""
+        return 'phone' if self.login_id.isdigit() else 'username'
+
 class ResetPasswordRequest(BaseModel):
     username: str
-    new_password: str
-    confirm_password: str
+    new_password: PasswordStr
+    confirm_password: str = Field(exclude=True, repr=False)
 
-    @validator('new_password')
-    def validate_password(cls, v):
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        if not re.search(r'[A-Z]', v):
-            raise ValueError('Must contain at least one uppercase letter')
-        if not re.search(r'[a-z]', v):
-            raise ValueError('Must contain at least one lowercase letter')
-        if not re.search(r'\d', v):
-            raise ValueError('Must contain at least one digit')
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', v):
-            raise ValueError('Must contain at least one special character')
-        return v
     
-    @validator('confirm_password')
-    def passwords_match(cls, v, values):
-        if 'new_password' in values and v != values['new_password']:
+    @model_validator(mode="after")
+    def passwords_match(self):
+        if not _secrets_equal(self.new_password, self.confirm_password):
             raise ValueError('Passwords do not match')
-        return v
+        return self
 
 class ThemeUpdateRequest(BaseModel):
     theme: Theme
 
-    @validator('theme')
-    def validate_theme(cls, v):
-        if v not in Theme:
-            raise ValueError(f'Theme must be one of: {[t.value for t in Theme]}')
-        return v
-
 
 # ---- Response Models ---- #
 class UserResponse(BaseModel):
@@ -578,8 +563,7 @@ class UserResponse(BaseModel):
     profile_picture_url: Optional[str] = None
     created_at: datetime
     
-    class Config:
-        model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, use_enum_values=True)
         
     @property
     def formatted_phone_number(self):
@@ -589,51 +573,28 @@ class OTPResponse(BaseModel):
     message: str
     expires_at: datetime
 
-class MessageResponse(BaseModel):
-    message: str
+    model_config = ConfigDict(frozen=True)
 
 class UserBase(BaseModel):
-    username: str
-    first_name: str
-    last_name: str
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    username: UsernameStr
+    first_name: NameStr
+    last_name: NameStr
     # email: Optional[EmailStr] = None
-    phone_number: str
+    phone_number: E164PhoneStr
     date_of_birth: date
     gender: Gender
     sexuality: Sexuality
     theme: Theme
     profile_picture_url: Optional[str] = None
 
-    @validator('first_name', 'last_name')
-    def validate_names(cls, v):
-        if not re.match(r'^[A-Za-z]+$', v):
-            raise ValueError('Name must contain only alphabetic characters')
-        return v
-
-    @validator('username')
-    def validate_username(cls, v):
-        if not v.islower():
-            raise ValueError('Username must be lowercase')
-        if not re.match(r'^[a-z0-9_\.]+$', v):
-            raise ValueError('Username must contain only lowercase letters, numbers, underscores (_) or dots (.)')
-        if len(v) < 3 or len(v) > 20:
-            raise ValueError('Username must be between 3 and 20 characters')
-        return v
-
-    @validator('date_of_birth')
+    @field_validator('date_of_birth')
+    @classmethod
     def validate_age(cls, v):
-        today = date.today()
-        age = today.year - v.year - ((today.month, today.day) < (v.month, v.day))
-        if age < 13:
+        if v > _latest_dob_for_min_age(date.today().toordinal()):
             raise ValueError('User must be at least 13 years old')
         return v
-        
-    @validator('phone_number')
-    def validate_phone_number(cls, v):
-        # Validate E.164 format with exactly 10 digits after country code
-        if not re.match(r'^\+[1-9]\d{1,3}\d{10}$', v):
-            raise ValueError('Phone number must be in E.164 format with exactly 10 digits after country code (e.g., +12345678901)')
-        return v
     
 class Token(BaseModel):
     """Schema for token response"""
@@ -641,6 +602,8 @@ class Token(BaseModel):
     refresh_token: str
     token_type: str = "bearer"
 
+    model_config = ConfigDict(frozen=True)
+
 class RefreshRequest(BaseModel):
     """Schema for refresh token request"""
     refresh_token: str
@@ -657,24 +620,13 @@ class CountryCodeResponse(BaseModel):
 
 # UserProfile schemas
 class UserProfileBase(BaseModel):
-    username: str
+    username: UsernameStr
     display_name: str
     bio: Optional[str] = Field(None, max_length=150)
     profile_image_url: Optional[str] = None
     age: int
-
-    @validator('username')
-    def validate_username(cls, v):
-        if not v.islower():
-            raise ValueError('Username must be lowercase')
-        if not re.match(r'^[a-z0-9_\.]+$', v):
-            raise ValueError('Username must contain only lowercase letters, numbers, underscores (_) or dots (.)')
-        if len(v) < 3 or len(v) > 20:
-            raise ValueError('Username must be between 3 and 20 characters')
-        return v
     
-    class Config:
-        model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True)
 
 class UserProfileCreate(BaseModel):
     username: str
@@ -684,22 +636,12 @@ class UserProfileCreate(BaseModel):
     location: Optional[str] = None
 
 class UserProfileUpdate(BaseModel):
-    username: Optional[str] = None
+    username: Optional[UsernameStr] = None
     display_name: Optional[str] = None
     bio: Optional[str] = None
     # location: Optional[str] = None
     account_type: Optional[AccountType] = None
-    
-    @validator('username')
-    def validate_username(cls, v):
-        if not v.islower():
-            raise ValueError('Username must be lowercase')
-        if not re.match(r'^[a-z0-9_\.]+$', v):
-            raise ValueError('Username must contain only lowercase letters, numbers, underscores (_) or dots (.)')
-        if len(v) < 3 or len(v) > 20:
-            raise ValueError('Username must be between 3 and 20 characters')
-        return v
-    
+        
 
 
 class UserProfilePublicResponse(BaseModel):
@@ -747,15 +689,7 @@ class PostResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
-class UserGridResponse(BaseModel):
-    post_count: int
-    posts: Union[List[PostResponse], str]
-    clips: Union[List[PostResponse], str]
-    tags: Union[List[PostResponse], str]
-
+    model_config = ConfigDict(from_attributes=True)
 
 # Connection Request schemas
 class ConnectionStatus(str, Enum):
@@ -832,6 +766,8 @@ class UsernameListResponse(BaseModel):
 class GenericMessageResponse(BaseModel):
     message: str
 
+    model_config = ConfigDict(frozen=True)
+
 
 # -------------------- CHAT ENUMS --------------------
 
@@ -876,8 +812,7 @@ class ChatResponse(BaseModel):
     blocked_by: Optional[int]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ChatRequestAction(BaseModel):
     action: Literal["accept", "decline", "block"]
@@ -891,8 +826,7 @@ class ChatSettingsUpdate(BaseModel):
     is_archived: Optional[bool] = None
     custom_background: Optional[str] = None  # URL or color code
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class MessageCreate(BaseModel):
     chat_id: Optional[UUID4] = None
@@ -945,15 +879,13 @@ class MessageReactionResponse(BaseModel):
     user_id: int
     emoji: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ReactionPreview(BaseModel):
     user_id: int
     emoji: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class MessageResponse(BaseModel):
     id: UUID4
@@ -969,8 +901,7 @@ class MessageResponse(BaseModel):
     seen_at: Optional[datetime]
     reactions: List[ReactionPreview] = []
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class MessageAction(str, Enum):
     send = "send"
@@ -1008,16 +939,14 @@ class GroupResponse(BaseModel):
     creator_id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
         
 class UserProfileOut(BaseModel):
     username: str
     display_name: str
     profile_image_url: str | None = None
 
-    class Config:
-        from_attributes = True  # Pydantic v2
+    model_config = ConfigDict(from_attributes=True)
         
 class BlockRequest(BaseModel):
     blocked_username: str  # username to be blocked
@@ -1027,8 +956,7 @@ class BlockedUserOut(BaseModel):
     first_name: str
     last_name: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class GroupMemberResponse(BaseModel):
@@ -1036,8 +964,7 @@ class GroupMemberResponse(BaseModel):
     role: GroupRole
     joined_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class GroupResponseWithMembers(GroupResponse):
     members: List[GroupMemberResponse]
@@ -1086,11 +1013,4 @@ class NotificationResponse(BaseModel):
     is_read: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
-
-# ------------------ Generic Response ------------------
-
-class GenericMessage(BaseModel):
-    message: str
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
@@ -3,20 +3,19 @@ import logging
 from fastapi import UploadFile
 import magic
 import re
-from typing import List
+from typing import List, Optional
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; re.ASCII keeps \d to [0-9]
+_E164_RE = re.compile(r'^\+[1-9]\d{1,14}$', re.ASCII)
+
 def validate_phone_number(phone: str) -> bool:
     """Validate phone number format (E.164)"""
-    if not phone:
+    # '+' plus 2-15 digits: reject the wrong length or a missing '+' before running the regex
+    if not phone or not 3 <= len(phone) <= 16 or phone[0] != '+':
         return False
-    return bool(re.match(r'^\+[1-9]\d{1,14}$', phone))
+    return bool(_E164_RE.match(phone))
 
 # def validate_email(email: str) -> bool:
 #     """Validate email format"""
@@ -25,9 +24,10 @@ def validate_phone_number(phone: str) -> bool:
 #     pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
 #     return bool(re.match(pattern, email))
 
-def calculate_age(birth_date: date) -> int:
-    """Calculate age from date of birth"""
-    today = date.today()
+def calculate_age(birth_date: date, today: Optional[date] = None) -> int:
+    """Calculate age from date of birth; pass `today` to reuse one date across a batch"""
+    if today is None:
+        today = date.today()
     return today.year - birth_date.year - ((today.month, today.day) < (birth_date.month, birth_date.day))
 
 def simulate_otp_delivery(method: str, destination: str, otp_code: str, purpose: str):
@@ -44,8 +44,11 @@ def simulate_otp_delivery(method: str, destination: str, otp_code: str, purpose:
     purpose_text = purpose_messages.get(purpose, "for verification")
     
     if method == 'phone':
-        message = f"Your verification code {purpose_text} is: {otp_code}"
-        logger.info(f"[WHATSAPP SIMULATION] To: {destination}, Message: {message}")
+        # %-style args are only formatted if INFO is enabled
+        logger.info(
+            "[WHATSAPP SIMULATION] To: %s, Message: Your verification code %s is: %s",
+            destination, purpose_text, otp_code
+        )
     # elif method == 'email':
     #     subject = f"Your verification code {purpose_text}"
     #     message = f"Your verification code is: {otp_code}\nThis code will expire in 5 minutes."
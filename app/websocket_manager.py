@@ -1,23 +1,45 @@
-from typing import Dict, Set
+from typing import Dict, List, Set, Tuple
 from fastapi import WebSocket
-from collections import defaultdict
 import asyncio
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _encode(data: dict) -> str:
+    """Serialize once for a fan-out, exactly as WebSocket.send_json would per socket"""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+async def _send_text_all(targets: List[Tuple[int, WebSocket]], text: str) -> List[Tuple[int, WebSocket]]:
+    """Send to every (user_id, websocket) concurrently and return the pairs whose send failed"""
+    results = await asyncio.gather(*(ws.send_text(text) for _, ws in targets), return_exceptions=True)
+    failed = []
+    for (user_id, websocket), result in zip(targets, results):
+        if isinstance(result, Exception):
+            logger.warning("Dropping websocket for user %s after failed send: %r", user_id, result)
+            failed.append((user_id, websocket))
+    return failed
+
+
+def _drop_if_current(connections: Dict[int, WebSocket], user_id: int, websocket: WebSocket):
+    """Forget a dead socket unless the user has already reconnected with a new one"""
+    if connections.get(user_id) is websocket:
+        del connections[user_id]
+
 
 class ConnectionManager:
     def __init__(self):
         self.active_connections: Dict[int, WebSocket] = {}  # user_id -> WebSocket
-        self.chat_subscribers: Dict[str, Set[int]] = defaultdict(set)  # chat_id -> user_ids
-        self.lock = asyncio.Lock()
+        self.chat_subscribers: Dict[str, Set[int]] = {}  # chat_id -> user_ids
 
     async def connect(self, user_id: int, websocket: WebSocket):
         await websocket.accept()
-        async with self.lock:
-            self.active_connections[user_id] = websocket
+        self.active_connections[user_id] = websocket
 
-    async def disconnect(self, user_id: int):
-        async with self.lock:
-            if user_id in self.active_connections:
-                del self.active_connections[user_id]
+    def disconnect(self, user_id: int):
+        self.active_connections.pop(user_id, None)
 
     async def send_to_user(self, user_id: int, data: dict):
         websocket = self.active_connections.get(user_id)
@@ -25,15 +47,26 @@ class ConnectionManager:
             await websocket.send_json(data)
 
     async def broadcast_to_chat(self, chat_id: str, data: dict):
-        subscribers = self.chat_subscribers.get(chat_id, set())
-        for user_id in subscribers:
-            await self.send_to_user(user_id, data)
+        subscribers = self.chat_subscribers.get(chat_id)
+        if not subscribers:
+            return
+        targets = [(user_id, ws) for user_id in subscribers if (ws := self.active_connections.get(user_id))]
+        # Send to every subscriber concurrently; one dead socket must not block or fail the rest
+        for user_id, websocket in await _send_text_all(targets, _encode(data)):
+            _drop_if_current(self.active_connections, user_id, websocket)
+            await self.leave_chat(user_id, chat_id)
 
     async def join_chat(self, user_id: int, chat_id: str):
-        self.chat_subscribers[chat_id].add(user_id)
+        self.chat_subscribers.setdefault(chat_id, set()).add(user_id)
 
     async def leave_chat(self, user_id: int, chat_id: str):
-        self.chat_subscribers[chat_id].discard(user_id)
+        subscribers = self.chat_subscribers.get(chat_id)
+        if subscribers is None:
+            return
+        subscribers.discard(user_id)
+        # Drop emptied chats so the dict only holds chats someone is watching
+        if not subscribers:
+            del self.chat_subscribers[chat_id]
 
     def is_online(self, user_id: int) -> bool:
         return user_id in self.active_connections
@@ -55,5 +88,6 @@ class NotificationWebSocketManager:
             await websocket.send_json(data)
 
     async def broadcast(self, data: dict):
-        for ws in self.active_connections.values():
-            await ws.send_json(data)
\ No newline at end of file
+        targets = list(self.active_connections.items())
+        for user_id, websocket in await _send_text_all(targets, _encode(data)):
+            _drop_if_current(self.active_connections, user_id, websocket)
\ No newline at end of file
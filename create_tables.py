@@ -4,5 +4,6 @@ from app import models
 
 # Create all tables based on the SQLAlchemy models
 Base.metadata.create_all(bind=engine)
+models.create_missing_indexes(engine)
 
 print("✅ Tables created successfully!")
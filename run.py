@@ -5,6 +5,7 @@ def create_tables():
     """Create all database tables"""
     print("Creating database tables...")
     models.Base.metadata.create_all(bind=engine)
+    models.create_missing_indexes(engine)
     print("Database tables created successfully!")
 
 if __name__ == "__main__":